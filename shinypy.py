@@ -7,19 +7,27 @@ import csv
 import requests
 import time
 import re
+import gc
+import tracemalloc
+from array import array
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFileDialog, QWidget, QDialog, QScrollArea,
     QGridLayout, QInputDialog, QTabWidget, QMenuBar, QMenu, QAction,
     QLineEdit, QComboBox, QFrame, QProgressBar, QCompleter, QMessageBox,
-    QSlider
+    QSlider, QProgressDialog
 )
-from PyQt5.QtGui import QIcon, QPixmap, QKeySequence
-from PyQt5.QtCore import Qt, QEvent, QTimer
+from PyQt5.QtGui import QIcon, QPixmap, QKeySequence, QPixmapCache, QFont
+from PyQt5.QtCore import Qt, QEvent, QTimer, QFileSystemWatcher, QStringListModel, QThread, pyqtSignal
 from pynput import keyboard
 from pygame import mixer
 from io import BytesIO
 
+try:
+    import psutil
+except ImportError:
+    psutil = None  # Listed in requirements.txt; RSS falls back to /proc on Linux
+
 
 def resource_path(relative_path):
     try:
@@ -60,6 +68,19 @@ SOUND_FILE = f"{SOUNDS_DIR}click.wav"
 HOTKEY_FILE = f"{CONFIG_DIR}hotkeys.csv"
 PKMN_FILE = f"{CONFIG_DIR}pkmn.yaml"
 
+# Progress Import/Export Settings
+PROGRESS_FILE_FILTER = "Hunt Progress (*.csv *.jsonl *.ndjson);;CSV (*.csv);;JSON Lines (*.jsonl *.ndjson)"
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+PROGRESS_REPORT_INTERVAL = 1000  # Records between progress updates
+
+# Memory Settings
+DEFAULT_PIXMAP_CACHE_KB = 10240  # Qt's own default
+LOW_MEMORY_PIXMAP_CACHE_KB = 1024
+TRACEMALLOC_TOP_COUNT = 10
+
+# Config Hot-Reload Settings
+CONFIG_RELOAD_DELAY_MS = 200  # Let editors finish writing before re-reading
+
 # UI Dimensions
 POKEMON_IMAGE_SIZE = (100, 100)
 MINIMUM_LABEL_WIDTH = 100
@@ -69,6 +90,9 @@ DEFAULT_COUNTER = 0
 MIN_COUNTER = 0
 MAX_COUNTER = 999999
 
+# Undo/Redo Settings
+UNDO_HISTORY_SIZE = 1000  # Counter changes kept per frame
+
 # Dialog Settings
 SET_COUNTER_DIALOG_TITLE = "Set Counter"
 SET_COUNTER_PROMPT = "Enter new count:"
@@ -97,14 +121,314 @@ SPRITE_URI = "https://pokemondb.net/sprites"
 COUNTER_LABEL_CLASS = "CounterLabel"
 IMAGE_LABEL_CLASS = "ImageLabel"
 
+# -- Progress Import/Export --
+def is_jsonl_path(path):
+    return path.lower().endswith(JSONL_EXTENSIONS)
+
+
+def iter_progress_records(path, on_progress=None):
+    """Yield (pokemon, count) from a CSV or JSON Lines file one record at a time"""
+    total_size = os.path.getsize(path) or 1
+    jsonl = is_jsonl_path(path)
+
+    with open(path, 'r', newline='', encoding='utf-8') as file:
+        rows = file if jsonl else csv.reader(file)
+        for line_number, row in enumerate(rows, start=1):
+            try:
+                if jsonl:
+                    if not row.strip():
+                        continue
+                    record = json.loads(row)
+                    pokemon, count = record["pokemon"], record["count"]
+                    # bool is an int subclass, and floats would be silently truncated
+                    if (not isinstance(pokemon, str) or isinstance(count, bool)
+                            or not isinstance(count, int)):
+                        continue
+                else:
+                    if len(row) != 2:
+                        continue
+                    pokemon, count = row[0], int(row[1])
+            except (ValueError, KeyError, TypeError, OverflowError):
+                # Headers and malformed lines are skipped rather than aborting a large import
+                continue
+
+            if pokemon and count >= MIN_COUNTER:
+                yield pokemon, count
+
+            if on_progress and line_number % PROGRESS_REPORT_INTERVAL == 0:
+                on_progress(min(100, file.buffer.tell() * 100 // total_size))
+
+    if on_progress:
+        on_progress(100)
+
+
+def read_progress_totals(path, on_progress=None):
+    """Sum the counts of every record per Pokémon; memory grows with species, not rows"""
+    totals = {}
+    for pokemon, count in iter_progress_records(path, on_progress):
+        totals[pokemon] = totals.get(pokemon, 0) + count
+    return totals
+
+
+def merge_progress(totals, combine=True):
+    """Merge totals into the progress file and return the merged progress data
+
+    With combine, imported counts are added to the stored ones, which pools
+    hunts from separate players or files. Importing the same file twice adds
+    it twice. Without combine (restore), each imported Pokémon's count
+    replaces the stored one, so restoring a backup can safely be repeated.
+    Pokémon missing from the import are left untouched in both modes.
+    """
+    progress_path = resource_path(PROGRESS_FILE)
+    merged = {}
+    if os.path.exists(progress_path):
+        for pokemon, count in iter_progress_records(progress_path):
+            merged[pokemon] = count
+
+    for pokemon, count in totals.items():
+        if combine:
+            count += merged.get(pokemon, 0)
+        merged[pokemon] = min(MAX_COUNTER, count)
+
+    # Write next to the original and swap, so a crash never leaves a truncated file
+    os.makedirs(os.path.dirname(progress_path), exist_ok=True)
+    temp_path = f"{progress_path}.tmp"
+    with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        for pokemon, count in merged.items():
+            writer.writerow([pokemon, count])
+    os.replace(temp_path, progress_path)
+
+    return {pokemon: str(count) for pokemon, count in merged.items()}
+
+
+def read_progress_snapshot():
+    """Current counts from the progress file, taken on the UI thread between saves"""
+    progress_path = resource_path(PROGRESS_FILE)
+    if not os.path.exists(progress_path):
+        return {}
+    return dict(iter_progress_records(progress_path))
+
+
+def export_progress(path, snapshot, on_progress=None):
+    """Write a progress snapshot to path as CSV or JSON Lines"""
+    jsonl = is_jsonl_path(path)
+    total = len(snapshot) or 1
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            for exported, (pokemon, count) in enumerate(snapshot.items(), start=1):
+                if jsonl:
+                    file.write(json.dumps({"pokemon": pokemon, "count": count}) + "\n")
+                else:
+                    writer.writerow([pokemon, count])
+                if on_progress and exported % PROGRESS_REPORT_INTERVAL == 0:
+                    on_progress(exported * 100 // total)
+        os.replace(temp_path, path)
+    except BaseException:
+        # Never leave a partial export behind, including when interrupted on close
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if on_progress:
+        on_progress(100)
+    return len(snapshot)
+
+
+class ProgressTransferWorker(QThread):
+    """Runs an import/export function off the UI thread so counting keeps working"""
+    progress = pyqtSignal(int)
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, function, *args, parent=None):
+        super().__init__(parent)
+        self.function = function
+        self.args = args
+
+    def report_progress(self, value):
+        # Progress callbacks double as cancellation points for closeEvent
+        if self.isInterruptionRequested():
+            raise InterruptedError
+        self.progress.emit(value)
+
+    def run(self):
+        try:
+            result = self.function(*self.args, on_progress=self.report_progress)
+        except InterruptedError:
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
+
+# -- Counter History --
+class CounterHistory:
+    """Fixed-capacity undo/redo ring buffer of (timestamp, delta) records"""
+
+    def __init__(self, capacity=UNDO_HISTORY_SIZE):
+        self.capacity = capacity
+        # Preallocated typed arrays, so memory stays the same however long the hunt runs
+        self.timestamps = array('d', [0.0]) * capacity
+        self.deltas = array('l', [0]) * capacity
+        self.head = 0
+        self.undo_size = 0
+        self.redo_size = 0
+
+    def push(self, delta):
+        self.timestamps[self.head] = time.time()
+        self.deltas[self.head] = delta
+        self.head = (self.head + 1) % self.capacity
+        # Oldest record is overwritten once full, and a new change drops the redo branch
+        self.undo_size = min(self.undo_size + 1, self.capacity)
+        self.redo_size = 0
+
+    def undo(self):
+        if not self.undo_size:
+            return None
+        self.head = (self.head - 1) % self.capacity
+        self.undo_size -= 1
+        self.redo_size += 1
+        return self.deltas[self.head]
+
+    def redo(self):
+        if not self.redo_size:
+            return None
+        delta = self.deltas[self.head]
+        self.head = (self.head + 1) % self.capacity
+        self.redo_size -= 1
+        self.undo_size += 1
+        return delta
+
+    def clear(self):
+        self.head = 0
+        self.undo_size = 0
+        self.redo_size = 0
+
+# -- Memory Diagnostics --
+def get_rss_bytes():
+    """Resident set size of this process, or None when it can't be determined"""
+    if psutil:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def pixmap_bytes(pixmap):
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class MemoryDiagnosticsWindow(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent = parent
+        self.setWindowTitle("Memory Diagnostics")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(520, 400)
+
+        # Allocation tracing costs memory itself, so it only runs while this view is open
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        self.finished.connect(self.on_finished)
+
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.report_label = QLabel()
+        self.report_label.setFont(QFont("Courier New"))
+        self.report_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.report_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(self.report_label)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+
+        stop_button = QPushButton("Stop Tracing")
+        stop_button.clicked.connect(self.stop_tracing)
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(stop_button)
+
+        layout.addWidget(scroll_area)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        rss = get_rss_bytes()
+        lines = [
+            f"RSS: {format_bytes(rss) if rss is not None else 'unavailable'}",
+            f"Low-memory mode: {'on' if self.parent.low_memory_mode else 'off'}",
+            f"Qt pixmap cache limit: {QPixmapCache.cacheLimit()} KB",
+            f"Species entries (shared): {self.parent.species_model.rowCount()}",
+            "",
+        ]
+
+        for frame in self.parent.hunt_frames():
+            lines += [
+                f"Frame {frame.frame_number}:",
+                f"  sprite URLs: {len(frame.spritedict)}",
+                f"  current image: {format_bytes(pixmap_bytes(frame.current_image))}",
+                f"  form entries: {frame.form_combobox.count()}",
+                f"  progress entries: {len(frame.progress_data)}",
+                f"  undo history: {frame.history.undo_size}/{frame.history.capacity}",
+                "",
+            ]
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"Traced Python memory: {format_bytes(current)} (peak {format_bytes(peak)})")
+            lines.append(f"Top {TRACEMALLOC_TOP_COUNT} allocators:")
+            top_stats = tracemalloc.take_snapshot().statistics("lineno")[:TRACEMALLOC_TOP_COUNT]
+            for stat in top_stats:
+                origin = stat.traceback[0]
+                lines.append(f"  {format_bytes(stat.size):>8}  {os.path.basename(origin.filename)}:{origin.lineno}")
+        else:
+            lines.append("Allocation tracing stopped.")
+
+        self.report_label.setText("\n".join(lines))
+
+    def stop_tracing(self):
+        tracemalloc.stop()
+        self.refresh()
+
+    def on_finished(self, _):
+        if self.started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
 # -- Options Window Constants --
+def hotkey_from_name(name):
+    return None if name == 'None' else getattr(keyboard.Key, name)
+
+
 class OptionsWindow(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.setWindowTitle("Options")
         self.setModal(True)
-        self.resize(300, 200)
+        self.resize(300, 360)
         self.init_ui()
         self.load_hotkeys()
 
@@ -116,6 +440,10 @@ class OptionsWindow(QDialog):
     def save_hotkeys(self):
         main_hotkey = self.main_hotkey_combo.currentText()
         secondary_hotkey = self.secondary_hotkey_combo.currentText()
+        undo_hotkey = self.undo_hotkey_combo.currentText()
+        redo_hotkey = self.redo_hotkey_combo.currentText()
+        secondary_undo_hotkey = self.secondary_undo_hotkey_combo.currentText()
+        secondary_redo_hotkey = self.secondary_redo_hotkey_combo.currentText()
 
         if not os.path.exists(CONFIG_DIR):
             os.makedirs(CONFIG_DIR)
@@ -124,13 +452,21 @@ class OptionsWindow(QDialog):
             writer = csv.writer(file)
             writer.writerow(["Main HOTKEY", main_hotkey])
             writer.writerow(["Secondary HOTKEY", secondary_hotkey])
+            writer.writerow(["Undo HOTKEY", undo_hotkey])
+            writer.writerow(["Redo HOTKEY", redo_hotkey])
+            writer.writerow(["Secondary Undo HOTKEY", secondary_undo_hotkey])
+            writer.writerow(["Secondary Redo HOTKEY", secondary_redo_hotkey])
 
-        # Update parent's hotkeys immediately
+        # Update parent's hotkeys immediately, the running listener picks them up
         if self.parent:
-            self.parent.main_hotkey = getattr(keyboard.Key, main_hotkey)
-            self.parent.secondary_hotkey = None if secondary_hotkey == 'None' else getattr(keyboard.Key,
-                                                                                           secondary_hotkey)
-            self.parent.restart_listener()
+            self.parent.hotkeys = (
+                getattr(keyboard.Key, main_hotkey),
+                hotkey_from_name(secondary_hotkey),
+                hotkey_from_name(undo_hotkey),
+                hotkey_from_name(redo_hotkey),
+                hotkey_from_name(secondary_undo_hotkey),
+                hotkey_from_name(secondary_redo_hotkey)
+            )
 
         self.accept()
 
@@ -139,7 +475,7 @@ class OptionsWindow(QDialog):
             if os.path.exists(HOTKEY_FILE):
                 with open(HOTKEY_FILE, 'r') as file:
                     reader = csv.reader(file)
-                    hotkeys = {rows[0]: rows[1] for rows in reader}
+                    hotkeys = {rows[0]: rows[1] for rows in reader if len(rows) == 2}
 
                     # Set current dropdown selections
                     main_hotkey = hotkeys.get("Main HOTKEY", "ctrl_r")
@@ -147,6 +483,18 @@ class OptionsWindow(QDialog):
 
                     secondary_hotkey = hotkeys.get("Secondary HOTKEY", "None")
                     self.secondary_hotkey_combo.setCurrentText(secondary_hotkey)
+
+                    undo_hotkey = hotkeys.get("Undo HOTKEY", "None")
+                    self.undo_hotkey_combo.setCurrentText(undo_hotkey)
+
+                    redo_hotkey = hotkeys.get("Redo HOTKEY", "None")
+                    self.redo_hotkey_combo.setCurrentText(redo_hotkey)
+
+                    secondary_undo_hotkey = hotkeys.get("Secondary Undo HOTKEY", "None")
+                    self.secondary_undo_hotkey_combo.setCurrentText(secondary_undo_hotkey)
+
+                    secondary_redo_hotkey = hotkeys.get("Secondary Redo HOTKEY", "None")
+                    self.secondary_redo_hotkey_combo.setCurrentText(secondary_redo_hotkey)
         except Exception as e:
             print(f"Error loading hotkeys: {e}")
 
@@ -163,6 +511,23 @@ class OptionsWindow(QDialog):
         self.secondary_hotkey_combo = QComboBox()
         self.secondary_hotkey_combo.addItems(['None'] + self.get_available_keys())
 
+        # Undo/Redo hotkey dropdowns, routed to the same frame as the main/secondary hotkey
+        self.undo_hotkey_label = QLabel("Undo Hotkey:")
+        self.undo_hotkey_combo = QComboBox()
+        self.undo_hotkey_combo.addItems(['None'] + self.get_available_keys())
+
+        self.redo_hotkey_label = QLabel("Redo Hotkey:")
+        self.redo_hotkey_combo = QComboBox()
+        self.redo_hotkey_combo.addItems(['None'] + self.get_available_keys())
+
+        self.secondary_undo_hotkey_label = QLabel("Secondary Undo Hotkey:")
+        self.secondary_undo_hotkey_combo = QComboBox()
+        self.secondary_undo_hotkey_combo.addItems(['None'] + self.get_available_keys())
+
+        self.secondary_redo_hotkey_label = QLabel("Secondary Redo Hotkey:")
+        self.secondary_redo_hotkey_combo = QComboBox()
+        self.secondary_redo_hotkey_combo.addItems(['None'] + self.get_available_keys())
+
         save_button = QPushButton("Save")
         save_button.clicked.connect(self.save_hotkeys)
 
@@ -170,15 +535,24 @@ class OptionsWindow(QDialog):
         layout.addWidget(self.main_hotkey_combo)
         layout.addWidget(self.secondary_hotkey_label)
         layout.addWidget(self.secondary_hotkey_combo)
+        layout.addWidget(self.undo_hotkey_label)
+        layout.addWidget(self.undo_hotkey_combo)
+        layout.addWidget(self.redo_hotkey_label)
+        layout.addWidget(self.redo_hotkey_combo)
+        layout.addWidget(self.secondary_undo_hotkey_label)
+        layout.addWidget(self.secondary_undo_hotkey_combo)
+        layout.addWidget(self.secondary_redo_hotkey_label)
+        layout.addWidget(self.secondary_redo_hotkey_combo)
         layout.addWidget(save_button)
 
 # -- HuntFrame Class --
 class HuntFrame(QFrame):
-    def __init__(self, parent=None, frame_number=1, pkmn_data=None):
+    def __init__(self, parent=None, frame_number=1, pkmn_data=None, species_model=None):
         super().__init__(parent)
         self.parent = parent
         self.frame_number = frame_number
         self.pkmn_data = pkmn_data
+        self.species_model = species_model
         self.last_api_call_time = 0
 
         # Initialize variables
@@ -188,6 +562,8 @@ class HuntFrame(QFrame):
         self.progress_data = {}
         self.spritedict = {}
         self.free_api_call = 2
+        self.history = CounterHistory()
+        self.low_memory = getattr(parent, 'low_memory_mode', False)
         self.current_sound_volume = DEFAULT_SOUND_VOLUME
 
         # Initialize pygame mixer for this frame
@@ -252,9 +628,12 @@ class HuntFrame(QFrame):
         # Pokemon Dropdown Menu
         self.pkmn_combobox = QComboBox()
         self.pkmn_combobox.setEditable(True)
-        completer = QCompleter(self.pkmn_data.keys(), self.pkmn_combobox)
+        # Typed text must not be inserted into the species list shared by every frame
+        self.pkmn_combobox.setInsertPolicy(QComboBox.NoInsert)
+        # Both frames' dropdowns and completers use the one species model owned by the main window
+        self.pkmn_combobox.setModel(self.species_model)
+        completer = QCompleter(self.species_model, self.pkmn_combobox)
         self.pkmn_combobox.setCompleter(completer)
-        self.pkmn_combobox.addItems(self.pkmn_data.keys())
         layout.addWidget(self.pkmn_combobox)
         self.pkmn_combobox.currentTextChanged.connect(self.fetch_forms)
 
@@ -269,16 +648,12 @@ class HuntFrame(QFrame):
   
   
     def increment_count(self):
-        self.counter += 1
-        self.update_counter()
-        self.save_progress()
+        self.apply_delta(1)
         self.add_sound.play()
 
     def decrement_count(self):
         if self.counter > 0:
-            self.counter -= 1
-            self.update_counter()
-            self.save_progress()
+            self.apply_delta(-1)
 
     def set_count(self):
         number, ok = QInputDialog.getInt(
@@ -289,10 +664,27 @@ class HuntFrame(QFrame):
             min=MIN_COUNTER,
             max=MAX_COUNTER
         )
-        if ok:
-            self.counter = number
-            self.update_counter()
-            self.save_progress()
+        if ok and number != self.counter:
+            self.apply_delta(number - self.counter)
+
+    def apply_delta(self, delta, record=True):
+        new_counter = max(MIN_COUNTER, min(MAX_COUNTER, self.counter + delta))
+        # Record what actually changed, so undoing a clamped change restores the count
+        if record and new_counter != self.counter:
+            self.history.push(new_counter - self.counter)
+        self.counter = new_counter
+        self.update_counter()
+        self.save_progress()
+
+    def undo_count(self):
+        delta = self.history.undo()
+        if delta is not None:
+            self.apply_delta(-delta, record=False)
+
+    def redo_count(self):
+        delta = self.history.redo()
+        if delta is not None:
+            self.apply_delta(delta, record=False)
 
     def update_counter(self):
         self.counter_label.setText(str(self.counter))
@@ -323,8 +715,9 @@ class HuntFrame(QFrame):
             response.raise_for_status()
             data = response.text
 
-            # Clear the form combobox
+            # Clear the form combobox, only the selected species' sprites are ever looked up
             self.form_combobox.clear()
+            self.spritedict.clear()
 
             pngs = re.findall(r'(?<=href=\")https://[^"]+\.png', data)
 
@@ -379,21 +772,45 @@ class HuntFrame(QFrame):
             print("Failed to load image from data.")
             return
 
-        self.current_image = pixmap
-        self.image_label.setPixmap(
-            self.current_image.scaled(
-                POKEMON_IMAGE_SIZE[0],
-                POKEMON_IMAGE_SIZE[1],
-                Qt.KeepAspectRatio
-            )
+        scaled_pixmap = pixmap.scaled(
+            POKEMON_IMAGE_SIZE[0],
+            POKEMON_IMAGE_SIZE[1],
+            Qt.KeepAspectRatio
         )
-
-        self.current_pokemon = self.pkmn_combobox.currentText()
+        self.current_image = scaled_pixmap if self.low_memory else pixmap
+        self.image_label.setPixmap(scaled_pixmap)
+
+        selected_pokemon = self.pkmn_combobox.currentText()
+        if selected_pokemon != self.current_pokemon:
+            # Recorded deltas belong to the previous Pokémon, never replay them onto this one
+            self.history.clear()
+        self.current_pokemon = selected_pokemon
         self.load_pokemon_count()
 
         self.save_progress()
         self.save_last_state()
 
+    def set_low_memory(self, enabled):
+        self.low_memory = enabled
+        if enabled and self.current_image:
+            # Drop the full-size original, the label only ever shows the scaled copy
+            self.current_image = self.current_image.scaled(
+                POKEMON_IMAGE_SIZE[0],
+                POKEMON_IMAGE_SIZE[1],
+                Qt.KeepAspectRatio
+            )
+
+    def release_resources(self):
+        """Free everything this frame holds before it is hidden for good"""
+        self.spritedict.clear()
+        self.progress_data.clear()
+        self.history.clear()
+        self.current_image = None
+        self.image_label.clear()
+        self.form_combobox.clear()
+        # The Sound itself goes with the frame; a queued hotkey press may still play it
+        self.add_sound.stop()
+
     def load_progress(self):
         try:
             if os.path.exists(resource_path(PROGRESS_FILE)):
@@ -443,8 +860,9 @@ class HuntFrame(QFrame):
                         reader = csv.reader(file)
                         all_progress = {row[0]: row[1] for row in reader if len(row) == 2}
 
-                # Update current Pokémon's data
+                # Update current Pokémon's data, in memory too so a form change doesn't reload a stale count
                 all_progress[self.current_pokemon] = str(self.counter)
+                self.progress_data[self.current_pokemon] = str(self.counter)
 
                 # Save all data back to file
                 os.makedirs(os.path.dirname(resource_path(PROGRESS_FILE)), exist_ok=True)
@@ -494,19 +912,24 @@ class ShinyCounter(QMainWindow):
         # Initialize pygame mixer
         mixer.init()
 
+        self.low_memory_mode = False
+
         # Load Pokemon YAML data
         self.pkmn_data = self.load_pkmn_data()
+        self.species_model = QStringListModel(list(self.pkmn_data.keys()), self)
 
         # Initialize hunt frames
-        self.hunt_frame_1 = HuntFrame(self, frame_number=1, pkmn_data=self.pkmn_data)
+        self.hunt_frame_1 = HuntFrame(self, frame_number=1, pkmn_data=self.pkmn_data,
+                                     species_model=self.species_model)
         self.hunt_frame_2 = None
 
         # Add first frame to layout
         self.main_layout.addWidget(self.hunt_frame_1)
 
         # Setup global hotkey listener
-        self.main_hotkey = HOTKEY_ADD
-        self.secondary_hotkey = None
+        # (main, secondary, undo, redo, secondary undo, secondary redo) is swapped as one tuple
+        # so the listener thread never sees a half update
+        self.hotkeys = (HOTKEY_ADD, None, None, None, None, None)
         self.load_hotkeys()
         self.listener = keyboard.Listener(on_press=self.on_press)
         self.listener.start()
@@ -515,11 +938,37 @@ class ShinyCounter(QMainWindow):
         self.init_menu_bar()
 
         # Load stylesheet
+        self.stylesheet_text = None
         self.load_stylesheet()
 
+        # Watch config files and apply changes in place
+        self.init_config_watcher()
+
     def init_menu_bar(self):
         menu_bar = self.menuBar()
         options_menu = menu_bar.addMenu("Options")
+        edit_menu = menu_bar.addMenu("Edit")
+
+        # Add Undo/Redo for each frame
+        undo_action = QAction("Undo Frame 1", self)
+        undo_action.setShortcut(QKeySequence.Undo)
+        undo_action.triggered.connect(lambda: self.undo_frame(1))
+        edit_menu.addAction(undo_action)
+
+        redo_action = QAction("Redo Frame 1", self)
+        redo_action.setShortcut(QKeySequence.Redo)
+        redo_action.triggered.connect(lambda: self.redo_frame(1))
+        edit_menu.addAction(redo_action)
+
+        self.undo_frame_2_action = QAction("Undo Frame 2", self)
+        self.undo_frame_2_action.setEnabled(False)
+        self.undo_frame_2_action.triggered.connect(lambda: self.undo_frame(2))
+        edit_menu.addAction(self.undo_frame_2_action)
+
+        self.redo_frame_2_action = QAction("Redo Frame 2", self)
+        self.redo_frame_2_action.setEnabled(False)
+        self.redo_frame_2_action.triggered.connect(lambda: self.redo_frame(2))
+        edit_menu.addAction(self.redo_frame_2_action)
 
         # Add Transparency Toggle
         transparency_action = QAction("Toggle Transparency", self)
@@ -544,6 +993,26 @@ class ShinyCounter(QMainWindow):
         self.hunt_mode_action.triggered.connect(self.toggle_hunt_mode)
         options_menu.addAction(self.hunt_mode_action)
 
+        # Add progress import/export options
+        import_progress_action = QAction("Import Progress...", self)
+        import_progress_action.triggered.connect(self.import_progress_file)
+        options_menu.addAction(import_progress_action)
+
+        export_progress_action = QAction("Export Progress...", self)
+        export_progress_action.triggered.connect(self.export_progress_file)
+        options_menu.addAction(export_progress_action)
+
+        # Add low-memory mode toggle
+        low_memory_action = QAction("Low-Memory Mode", self)
+        low_memory_action.setCheckable(True)
+        low_memory_action.triggered.connect(self.toggle_low_memory_mode)
+        options_menu.addAction(low_memory_action)
+
+        # Add memory diagnostics view
+        diagnostics_action = QAction("Memory Diagnostics", self)
+        diagnostics_action.triggered.connect(self.show_memory_diagnostics)
+        options_menu.addAction(diagnostics_action)
+
         # Add Update PKMN JSON option
         load_progress_action = QAction("Update Pokemon", self)
         load_progress_action.triggered.connect(self.update_pkmn_json)
@@ -582,47 +1051,160 @@ class ShinyCounter(QMainWindow):
         self.options_window = OptionsWindow(self)
         self.options_window.show()
 
+    def show_memory_diagnostics(self):
+        # Reuse the open view, it deletes itself when closed
+        if getattr(self, 'diagnostics_window', None):
+            self.diagnostics_window.raise_()
+            self.diagnostics_window.activateWindow()
+            return
+
+        self.diagnostics_window = MemoryDiagnosticsWindow(self)
+        self.diagnostics_window.finished.connect(self.clear_diagnostics_window)
+        self.diagnostics_window.show()
+
+    def clear_diagnostics_window(self):
+        self.diagnostics_window = None
+
+    def toggle_low_memory_mode(self, enabled):
+        self.low_memory_mode = enabled
+        for frame in self.hunt_frames():
+            frame.set_low_memory(enabled)
+
+        if enabled:
+            QPixmapCache.setCacheLimit(LOW_MEMORY_PIXMAP_CACHE_KB)
+            QPixmapCache.clear()
+            gc.collect()
+        else:
+            QPixmapCache.setCacheLimit(DEFAULT_PIXMAP_CACHE_KB)
+
+    def get_frame(self, frame_number):
+        return self.hunt_frame_2 if frame_number == 2 else self.hunt_frame_1
+
+    def undo_frame(self, frame_number):
+        # Looked up on the UI thread, frame 2 may be gone by the time this runs
+        frame = self.get_frame(frame_number)
+        if frame:
+            frame.undo_count()
+
+    def redo_frame(self, frame_number):
+        frame = self.get_frame(frame_number)
+        if frame:
+            frame.redo_count()
+
     def on_press(self, key):
+        (main_hotkey, secondary_hotkey, undo_hotkey, redo_hotkey,
+         secondary_undo_hotkey, secondary_redo_hotkey) = self.hotkeys
+        # Undo/redo follow the same routing as the increment hotkeys
+        main_frame_number = 2 if self.hunt_mode_action.isChecked() and self.hunt_frame_2 else 1
         try:
-            if key == self.main_hotkey:
-                if self.hunt_mode_action.isChecked() and self.hunt_frame_2:
+            if key == main_hotkey:
+                if main_frame_number == 2:
                     QTimer.singleShot(0, self.hunt_frame_2.increment_count)
                 else:
                     QTimer.singleShot(0, self.hunt_frame_1.increment_count)
-            elif key == self.secondary_hotkey:
+            elif key == secondary_hotkey:
                 QTimer.singleShot(0, self.hunt_frame_1.increment_count)
+            elif key == undo_hotkey:
+                QTimer.singleShot(0, lambda: self.undo_frame(main_frame_number))
+            elif key == redo_hotkey:
+                QTimer.singleShot(0, lambda: self.redo_frame(main_frame_number))
+            elif key == secondary_undo_hotkey:
+                QTimer.singleShot(0, lambda: self.undo_frame(1))
+            elif key == secondary_redo_hotkey:
+                QTimer.singleShot(0, lambda: self.redo_frame(1))
         except AttributeError:
             pass
 
     def load_hotkeys(self):
+        # On a bad or half-written file the current bindings are kept
         try:
-            if os.path.exists(HOTKEY_FILE):
+            if os.path.exists(resource_path(HOTKEY_FILE)):
                 with open(resource_path(HOTKEY_FILE), 'r') as file:
                     reader = csv.reader(file)
-                    hotkeys = {rows[0]: rows[1] for rows in reader}
+                    hotkeys = {rows[0]: rows[1] for rows in reader if len(rows) == 2}
                     main_hotkey = hotkeys.get("Main HOTKEY", "ctrl_r")
                     secondary_hotkey = hotkeys.get("Secondary HOTKEY", "None")
-
-                    self.main_hotkey = getattr(keyboard.Key, main_hotkey, HOTKEY_ADD)
-                    self.secondary_hotkey = None if secondary_hotkey == 'None' else getattr(keyboard.Key,
-                                                                                            secondary_hotkey)
+                    undo_hotkey = hotkeys.get("Undo HOTKEY", "None")
+                    redo_hotkey = hotkeys.get("Redo HOTKEY", "None")
+                    secondary_undo_hotkey = hotkeys.get("Secondary Undo HOTKEY", "None")
+                    secondary_redo_hotkey = hotkeys.get("Secondary Redo HOTKEY", "None")
+
+                    self.hotkeys = (
+                        getattr(keyboard.Key, main_hotkey, HOTKEY_ADD),
+                        hotkey_from_name(secondary_hotkey),
+                        hotkey_from_name(undo_hotkey),
+                        hotkey_from_name(redo_hotkey),
+                        hotkey_from_name(secondary_undo_hotkey),
+                        hotkey_from_name(secondary_redo_hotkey)
+                    )
         except Exception as e:
             print(f"Error loading hotkeys: {e}")
-            self.main_hotkey = HOTKEY_ADD
-            self.secondary_hotkey = None
-
-    def restart_listener(self):
-        if hasattr(self, 'listener'):
-            self.listener.stop()
-        self.listener = keyboard.Listener(on_press=self.on_press)
-        self.listener.start()
 
     def load_stylesheet(self):
         try:
-            with open(resource_path(STYLESHEET_PATH), "r") as file:
-                self.setStyleSheet(file.read())
+            with open(resource_path(STYLESHEET_PATH), "r", encoding="utf-8") as file:
+                stylesheet = file.read()
         except FileNotFoundError:
             print("Stylesheet not found. Using default styles.")
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            # An editor may still be writing it, keep the current styles
+            print(f"Error loading stylesheet: {e}")
+            return
+
+        # Re-polishing every widget is expensive, skip saves that changed nothing
+        if stylesheet != self.stylesheet_text:
+            self.stylesheet_text = stylesheet
+            self.setStyleSheet(stylesheet)
+
+    def init_config_watcher(self):
+        self.config_handlers = {
+            resource_path(HOTKEY_FILE): self.load_hotkeys,
+            resource_path(STYLESHEET_PATH): self.load_stylesheet,
+            resource_path(PKMN_FILE): self.reload_pkmn_data,
+        }
+        self.pending_config_paths = set()
+
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(CONFIG_RELOAD_DELAY_MS)
+        self.config_reload_timer.timeout.connect(self.apply_config_changes)
+
+        self.config_watcher = QFileSystemWatcher(self)
+        for path in self.config_handlers:
+            if os.path.exists(path):
+                self.config_watcher.addPath(path)
+        self.config_watcher.fileChanged.connect(self.on_config_file_changed)
+
+        # Watch the directory too, so files created after startup get picked up
+        config_dir = resource_path(CONFIG_DIR)
+        os.makedirs(config_dir, exist_ok=True)
+        self.config_watcher.addPath(config_dir)
+        self.config_watcher.directoryChanged.connect(self.on_config_dir_changed)
+
+    def on_config_file_changed(self, path):
+        self.pending_config_paths.add(path)
+        self.config_reload_timer.start()
+
+    def on_config_dir_changed(self, _):
+        watched = self.config_watcher.files()
+        for path in self.config_handlers:
+            if path not in watched and os.path.exists(path):
+                self.config_watcher.addPath(path)
+                self.on_config_file_changed(path)
+
+    def apply_config_changes(self):
+        watched = self.config_watcher.files()
+        for path in self.pending_config_paths:
+            # Editors that save by replacing the file drop it from the watcher
+            if path not in watched and os.path.exists(path):
+                self.config_watcher.addPath(path)
+            try:
+                self.config_handlers[path]()
+            except Exception as e:
+                # An exception escaping a Qt slot aborts the app, one bad file must not
+                print(f"Error reloading {path}: {e}")
+        self.pending_config_paths.clear()
 
     def toggle_transparency(self):
         current_opacity = self.windowOpacity()
@@ -637,10 +1219,13 @@ class ShinyCounter(QMainWindow):
         if self.hunt_mode_action.isChecked():
             # Switch to double hunting
             if not self.hunt_frame_2:
-                self.hunt_frame_2 = HuntFrame(self, frame_number=2, pkmn_data=self.pkmn_data)
+                self.hunt_frame_2 = HuntFrame(self, frame_number=2, pkmn_data=self.pkmn_data,
+                                         species_model=self.species_model)
             self.hunt_frame_2.show()
             self.main_layout.addWidget(self.hunt_frame_2)
             self.hunt_mode_action.setText("Single-Hunting")
+            self.undo_frame_2_action.setEnabled(True)
+            self.redo_frame_2_action.setEnabled(True)
 
             # Update window constraints for double hunting
             self.setMinimumSize(*DOUBLE_MINIMUM_WINDOW_SIZE)
@@ -650,10 +1235,15 @@ class ShinyCounter(QMainWindow):
             # Switch to single hunting
             if self.hunt_frame_2:
                 self.hunt_frame_2.hide()
+                self.hunt_frame_2.release_resources()
                 self.main_layout.removeWidget(self.hunt_frame_2)
                 self.hunt_frame_2.deleteLater()
                 self.hunt_frame_2 = None
+                if self.low_memory_mode:
+                    gc.collect()
             self.hunt_mode_action.setText("Double-Hunting")
+            self.undo_frame_2_action.setEnabled(False)
+            self.redo_frame_2_action.setEnabled(False)
 
             # Restore original window constraints
             self.setMinimumSize(*MINIMUM_WINDOW_SIZE)
@@ -670,6 +1260,136 @@ class ShinyCounter(QMainWindow):
             self.show_messagebox("Error", "Pokémon data file not found. Please update Pokémon data.")
             return {}
 
+    def hunt_frames(self):
+        return [frame for frame in (self.hunt_frame_1, self.hunt_frame_2) if frame]
+
+    def import_progress_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Progress", "", PROGRESS_FILE_FILTER)
+        if not path:
+            return
+
+        # Summing is right for other players' hunts but doubles counts on a repeated import
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Import Progress")
+        msg_box.setText("How should the imported counts be applied?")
+        msg_box.setInformativeText(
+            "Combine adds them to your current counts, for merging other hunts.\n"
+            "Restore replaces your counts for the imported Pokémon, for backups."
+        )
+        combine_button = msg_box.addButton("Combine", QMessageBox.AcceptRole)
+        restore_button = msg_box.addButton("Restore", QMessageBox.AcceptRole)
+        msg_box.addButton(QMessageBox.Cancel)
+        msg_box.exec_()
+
+        clicked = msg_box.clickedButton()
+        if clicked not in (combine_button, restore_button):
+            return
+
+        combine = clicked == combine_button
+        self.start_progress_transfer("Importing progress...",
+                                     lambda totals: self.finish_import_progress(totals, combine),
+                                     read_progress_totals, path)
+
+    def finish_import_progress(self, totals, combine):
+        # Flush live counts first so the merge starts from them instead of stale ones
+        for frame in self.hunt_frames():
+            frame.save_progress()
+
+        try:
+            merged = merge_progress(totals, combine)
+        except Exception as e:
+            self.show_messagebox("Error", f"Failed to import progress: {e}")
+            return
+
+        for frame in self.hunt_frames():
+            frame.progress_data = dict(merged)
+            frame.load_pokemon_count()
+        self.show_messagebox("Import Progress", f"Imported progress for {len(totals)} Pokémon.")
+
+    def export_progress_file(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Progress", "", PROGRESS_FILE_FILTER)
+        if not path:
+            return
+
+        for frame in self.hunt_frames():
+            frame.save_progress()
+
+        # The worker gets a snapshot, since every press rewrites the progress file
+        try:
+            snapshot = read_progress_snapshot()
+        except Exception as e:
+            self.show_messagebox("Error", f"Failed to export progress: {e}")
+            return
+
+        self.start_progress_transfer(
+            "Exporting progress...",
+            lambda exported: self.show_messagebox("Export Progress", f"Exported {exported} Pokémon."),
+            export_progress, path, snapshot
+        )
+
+    def start_progress_transfer(self, label, on_success, function, *args):
+        if getattr(self, 'transfer_worker', None) and self.transfer_worker.isRunning():
+            self.show_messagebox("Error", "An import or export is already running.")
+            return
+
+        # Non-modal so the overlay and hotkeys stay usable while it runs
+        self.transfer_dialog = QProgressDialog(label, None, 0, 100, self)
+        self.transfer_dialog.setWindowTitle(APP_NAME)
+        self.transfer_dialog.setWindowModality(Qt.NonModal)
+        self.transfer_dialog.setMinimumDuration(0)
+        self.transfer_dialog.setValue(0)
+
+        self.transfer_worker = ProgressTransferWorker(function, *args, parent=self)
+        self.transfer_worker.progress.connect(self.transfer_dialog.setValue)
+        self.transfer_worker.succeeded.connect(on_success)
+        self.transfer_worker.failed.connect(
+            lambda error: self.show_messagebox("Error", f"Failed to transfer progress: {error}")
+        )
+        self.transfer_worker.finished.connect(self.transfer_dialog.close)
+        self.transfer_worker.start()
+
+    def reload_pkmn_data(self):
+        try:
+            with open(resource_path(PKMN_FILE), "r", encoding="utf-8") as file:
+                new_data = yaml.safe_load(file)
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            print(f"Error reloading Pokémon data: {e}")
+            return
+
+        if not isinstance(new_data, dict):
+            return
+
+        removed = [name for name in self.pkmn_data if name not in new_data]
+        added = [(position, name) for position, name in enumerate(new_data) if name not in self.pkmn_data]
+
+        # Frames share this dict, so update it in place
+        self.pkmn_data.clear()
+        self.pkmn_data.update(new_data)
+
+        if added or removed:
+            self.update_species(added, removed)
+
+    def update_species(self, added, removed):
+        """Apply species additions/removals to the shared model, keeping each frame's selection"""
+        frames = self.hunt_frames()
+        current_texts = [frame.pkmn_combobox.currentText() for frame in frames]
+        for frame in frames:
+            frame.pkmn_combobox.blockSignals(True)
+
+        species = self.species_model.stringList()
+        removed_rows = sorted((species.index(name) for name in removed if name in species), reverse=True)
+        for row in removed_rows:
+            self.species_model.removeRows(row, 1)
+
+        # added is (position, name) in the new file order, ascending
+        for position, name in added:
+            self.species_model.insertRows(position, 1)
+            self.species_model.setData(self.species_model.index(position), name)
+
+        for frame, current_text in zip(frames, current_texts):
+            frame.pkmn_combobox.setCurrentText(current_text)
+            frame.pkmn_combobox.blockSignals(False)
+
     def update_pkmn_json(self):
         try:
             BASE = "https://pokeapi.co/api/v2/"
@@ -705,6 +1425,11 @@ class ShinyCounter(QMainWindow):
         msg_box.exec_()
 
     def closeEvent(self, event):
+        # Stop a running import/export before Qt destroys its thread
+        if getattr(self, 'transfer_worker', None) and self.transfer_worker.isRunning():
+            self.transfer_worker.requestInterruption()
+            self.transfer_worker.wait()
+
         # Save state for both frames
         self.hunt_frame_1.save_progress()
         self.hunt_frame_1.save_last_state()